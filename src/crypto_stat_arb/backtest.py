@@ -1,26 +1,39 @@
 from __future__ import annotations
 import numpy as np
 import pandas as pd
-import sys
-from pathlib import Path
 
-HERE = Path(__file__).resolve()
-SRC = HERE.parents[1]          
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+from .config import ANNUALIZATION
 
-from crypto_stat_arb.config import ANNUALIZATION # type: ignore
+def _backtest_np(W: np.ndarray, X: np.ndarray, cost_rate: float):
+    """
+    Backtest kernel on aligned (T, N) weight / return arrays (same rows and columns).
+    Row t earns W[t-1] * X[t]; pairs rows through views (no shifted copy of W).
+    Returns float64 arrays (net, gross, turnover).
+    """
+    W = np.asarray(W, dtype=np.float64)
+    X = np.asarray(X, dtype=np.float64)
+    W_prev = W[:-1]
+
+    gross = np.zeros(len(W))  # P&L per bar
+    turnover = np.zeros(len(W))
+    gross[1:] = np.nansum(W_prev * X[1:], axis=1)    # NaN weights / returns add nothing
+    turnover[1:] = np.nansum(np.abs(W[1:] - W_prev), axis=1)
+    return gross - cost_rate * turnover, gross, turnover
 
 def backtest(w: pd.DataFrame, R: pd.DataFrame, cost_rate: float):
     """
     Vectorized backtest with no lookahead (weights applied with shift()).
+    Aligns w and R, then runs _backtest_np on the ndarrays.
     Returns: (net_series, gross_series, summary_series)
     """
     cols = w.columns.intersection(R.columns)
-    w, R = w[cols], R[cols]
+    w = w[cols]
+    R = R[cols] if R.index.equals(w.index) else R[cols].reindex(w.index)
+
+    _, gross_arr, turn_arr = _backtest_np(w.to_numpy(), R.to_numpy(), cost_rate)
 
-    gross = (w.shift().fillna(0.0) * R).sum(axis=1)  # P&L per bar
-    turnover = (w - w.shift()).abs().sum(axis=1).fillna(0.0)
+    gross = pd.Series(gross_arr, index=w.index)
+    turnover = pd.Series(turn_arr, index=w.index)
     cost = cost_rate * turnover
     net = gross - cost
 
@@ -41,17 +54,24 @@ def backtest(w: pd.DataFrame, R: pd.DataFrame, cost_rate: float):
     }
     return net, gross, pd.Series(summary)
 
-def perf_stats(x: pd.Series) -> dict:
-    mu, sd = x.mean(), x.std()
+def perf_stats(x: pd.Series | np.ndarray) -> dict:
+    x = np.asarray(x, dtype=np.float64)  # float64 accumulators even for float32 input
+    x = x[~np.isnan(x)]                  # NaN bars skipped, as pandas mean/std do
+    mu = x.mean() if x.size else np.nan
+    sd = x.std(ddof=1) if x.size > 1 else np.nan
     sh = np.nan if sd == 0 or np.isnan(sd) else (mu / sd) * np.sqrt(ANNUALIZATION)
     return {"ann_ret": mu * ANNUALIZATION, "ann_vol": sd * np.sqrt(ANNUALIZATION), "sharpe": sh}
 
 def max_drawdown(x: pd.Series) -> float:
     """
     Max drawdown on cumulative arithmetic equity (not log).
-    Input is a return series per bar (arithmetic).
+    Input is a return series per bar (arithmetic); NaN bars count as flat.
+    Works on one ndarray buffer: equity and drawdown ratio are written in place.
     """
-    eq = (1 + x.fillna(0)).cumprod()
-    peak = eq.cummax()
-    dd = eq / peak - 1.0
-    return float(dd.min())
\ No newline at end of file
+    eq = np.nan_to_num(np.asarray(x, dtype=np.float64), nan=0.0)
+    if eq.size == 0:
+        return np.nan
+    eq += 1.0
+    np.cumprod(eq, out=eq)
+    eq /= np.maximum.accumulate(eq)
+    return float(eq.min() - 1.0)
\ No newline at end of file
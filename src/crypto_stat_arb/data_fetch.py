@@ -2,6 +2,11 @@ from binance.client import Client as bnb_client
 import pandas as pd, numpy as np, time, os
 from typing import Optional, Union
 
+try:
+    from .panel import assemble_panel, ffill_dropna
+except ImportError:  # run as a script from this directory
+    from panel import assemble_panel, ffill_dropna
+
 # ---------- Config ----------
 USE_BINANCE_US = True
 ALLOWED_QUOTES = {"USDT"}          # Keep only USDT-quoted pairs for consistency
@@ -65,34 +70,29 @@ def get_klines_df(client, symbol, interval, start_ts, end_ts=None, pause=0.25):
     start_ms = to_ms(start_ts)
     end_ms   = to_ms(end_ts)
     data = client.get_historical_klines(symbol, interval, start_ms, end_ms)
-    cols = ['open_time','open','high','low','close','volume','close_time',
-            'quote_volume','num_trades','taker_base_volume','taker_quote_volume','ignore']
-    df = pd.DataFrame(data, columns=cols)
-    if df.empty:
-        return df
-    df["open_time"]  = pd.to_datetime(df["open_time"], unit="ms", utc=True)
-    df["close_time"] = pd.to_datetime(df["close_time"], unit="ms", utc=True)
-    for c in ["open","high","low","close","volume","quote_volume"]:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
+    if not data:
+        return pd.Series(dtype=np.float64, name=symbol)
+    # only open_time (col 0) and close (col 4) are used downstream
+    ot = np.fromiter((r[0] for r in data), dtype=np.int64, count=len(data))
+    cl = np.fromiter((float(r[4]) for r in data), dtype=np.float64, count=len(data))
     time.sleep(pause)
-    return df.set_index("open_time")
+    return pd.Series(cl, index=pd.to_datetime(ot, unit="ms", utc=True), name=symbol)
 
 def build_px_ret(client, symbols, interval, start_ts, end_ts=None):
     series = {}
     for sym in symbols:
-        df = get_klines_df(client, sym, interval, start_ts, end_ts, pause=PAUSE)
-        if df.empty:
+        s = get_klines_df(client, sym, interval, start_ts, end_ts, pause=PAUSE)
+        if s.empty:
             continue
-        series[sym] = df["close"].astype(float).rename(sym)
+        series[sym] = s
     if not series:
         raise ValueError("No data returned. Check interval/range/symbols.")
-    px = pd.concat(series.values(), axis=1).sort_index()
+    px = assemble_panel(series)
 
     full_idx = pd.date_range(px.index.min(), px.index.max(), freq=interval, tz="UTC")
-    px = px.reindex(full_idx).ffill()
-    px = px.dropna(how="any").copy()
+    px = ffill_dropna(px.reindex(full_idx))
 
-    ret = np.log(px / px.shift(1)).dropna()
+    ret = pd.DataFrame(np.diff(np.log(px.to_numpy()), axis=0), index=px.index[1:], columns=px.columns)
     return px, ret
 
 if __name__ == "__main__":
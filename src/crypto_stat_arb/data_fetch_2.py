@@ -2,13 +2,19 @@
 """
 Full historical hourly (1h) crypto prices from Binance / Binance.US
 with pagination from START to END (or now), universe selection by
-Top N quote volume (USDT pairs), and CSV output for prices & returns.
+Top N quote volume (USDT pairs), and CSV + Parquet output for prices & returns.
 """
 
 from binance.client import Client as bnb_client
-import pandas as pd, numpy as np, time, os, math, sys
+import pandas as pd, numpy as np, time, os, math, sys, threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Union
 
+try:
+    from .panel import assemble_panel, ffill_dropna
+except ImportError:  # run as a script from this directory
+    from panel import assemble_panel, ffill_dropna
+
 # ─────────────────────────────── Config ───────────────────────────────
 USE_BINANCE_US = True
 ALLOWED_QUOTES = {"USDT"}        # keep only USDT-quoted pairs
@@ -18,6 +24,8 @@ START = "2023-01-01"
 END   = None                     # None => up to exchange "now"
 PAUSE = 0.25                     # pause between API calls (rate-limit friendly)
 LIMIT = 1000                     # klines per page (API max is usually 1000)
+MAX_WORKERS = 8                  # symbols fetched concurrently
+MAX_INFLIGHT = 4                 # concurrent get_klines calls (shared across workers)
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 # ---------------------------------------------------------------------
 
@@ -33,6 +41,9 @@ client = bnb_client(tld='us' if USE_BINANCE_US else 'com')
 STABLE_BASES = {"USDT","USDC","BUSD","DAI","TUSD","FDUSD","USD"}
 BAD_SUFFIXES = ("UPUSDT","DOWNUSDT","BULLUSDT","BEARUSDT","UP","DOWN","BULL","BEAR")
 
+# Shared across fetch threads so total request rate stays bounded
+_API_SLOTS = threading.Semaphore(MAX_INFLIGHT)
+
 def to_ms(ts: Optional[Union[str, pd.Timestamp]]) -> Optional[int]:
     if ts is None:
         return None
@@ -81,7 +92,10 @@ def top_by_quote_volume(client, candidates, top_n):
 def get_klines_df(client, symbol, interval, start_ts, end_ts=None, pause=0.25, limit=1000, max_pages=200000):
     """
     Robust kline fetcher that paginates from start_ts to end_ts (or now),
-    returning a full DataFrame indexed by open_time.
+    returning the float close series (named `symbol`) indexed by open_time.
+    Only open_time and close are parsed; the other kline fields are skipped.
+    Each API call holds one of the shared _API_SLOTS (plus `pause`) so concurrent
+    fetchers stay rate-limit friendly.
     """
     start_ms = to_ms(start_ts)
     end_ms   = to_ms(end_ts)  # None -> open-ended to exchange "now"
@@ -89,13 +103,15 @@ def get_klines_df(client, symbol, interval, start_ts, end_ts=None, pause=0.25, l
     pages = 0
 
     while True:
-        batch = client.get_klines(
-            symbol=symbol,
-            interval=interval,
-            startTime=start_ms,
-            endTime=end_ms,
-            limit=limit
-        )
+        with _API_SLOTS:
+            batch = client.get_klines(
+                symbol=symbol,
+                interval=interval,
+                startTime=start_ms,
+                endTime=end_ms,
+                limit=limit
+            )
+            time.sleep(pause)
         if not batch:
             break
 
@@ -112,39 +128,31 @@ def get_klines_df(client, symbol, interval, start_ts, end_ts=None, pause=0.25, l
         if len(batch) < limit:
             # Try one more pull; if empty, we'll exit next loop
             start_ms = last_open_ms + 1
-            time.sleep(pause)
             continue
 
         # Advance the window by 1ms past the last open_time to avoid duplicates
         start_ms = last_open_ms + 1
 
-        time.sleep(pause)
-
         if pages >= max_pages:
             print(f"[WARN] Stopping pagination for {symbol}: reached max_pages={max_pages}", file=sys.stderr)
             break
 
-    cols = [
-        'open_time','open','high','low','close','volume','close_time',
-        'quote_volume','num_trades','taker_base_volume','taker_quote_volume','ignore'
-    ]
     if not rows:
-        return pd.DataFrame(columns=cols).set_index('open_time')
+        return pd.Series(dtype=np.float64, name=symbol)
 
-    df = pd.DataFrame(rows, columns=cols)
-    df["open_time"]  = pd.to_datetime(df["open_time"], unit="ms", utc=True)
-    df["close_time"] = pd.to_datetime(df["close_time"], unit="ms", utc=True)
+    # kline row layout: [open_time, open, high, low, close, volume, close_time, ...]
+    ot = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    cl = np.fromiter((float(r[4]) for r in rows), dtype=np.float64, count=len(rows))
 
-    for c in ["open","high","low","close","volume","quote_volume"]:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
+    s = pd.Series(cl, index=pd.to_datetime(ot, unit="ms", utc=True), name=symbol)
+    return s.sort_index()
 
-    df = df.set_index("open_time").sort_index()
-    return df
-
-def build_px_ret(client, symbols, interval, start_ts, end_ts=None, pause=0.25, limit=1000):
+def build_px_ret(client, symbols, interval, start_ts, end_ts=None, pause=0.25, limit=1000,
+                 max_workers=MAX_WORKERS):
     """
     Fetch closes for each symbol, DROP any symbol that doesn't have data at or before start_ts,
     align on a common window, forward-fill gaps within the window, and compute log returns.
+    Symbols are fetched concurrently on up to `max_workers` threads.
     """
     # Normalize START as UTC timestamp for comparisons
     min_start = pd.Timestamp(start_ts)
@@ -156,19 +164,29 @@ def build_px_ret(client, symbols, interval, start_ts, end_ts=None, pause=0.25, l
     series = {}
     starts, ends = {}, {}
 
-    # 1) Fetch close series per symbol
-    for i, sym in enumerate(symbols, 1):
-        print(f"[{i}/{len(symbols)}] Fetching {sym} ...", flush=True)
-        df = get_klines_df(client, sym, interval, start_ts, end_ts, pause=pause, limit=limit)
-        if df.empty:
-            print(f"  -> No data for {sym} (skipping).")
-            continue
-
-        s = df["close"].astype(float).rename(sym).sort_index()
-        starts[sym] = s.index.min()
-        ends[sym]   = s.index.max()
-        series[sym] = s
-        print(f"  -> {sym} range: {starts[sym]} → {ends[sym]}  ({len(s)} rows)")
+    # 1) Fetch close series per symbol (network-bound, so threads overlap the RTTs)
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {
+            ex.submit(get_klines_df, client, sym, interval, start_ts, end_ts, pause=pause, limit=limit): sym
+            for sym in symbols
+        }
+        for i, fut in enumerate(as_completed(futures), 1):
+            sym = futures[fut]
+            s = fut.result()
+            if s.empty:
+                print(f"[{i}/{len(symbols)}] No data for {sym} (skipping).", flush=True)
+                continue
+            fetched[sym] = s
+            print(f"[{i}/{len(symbols)}] {sym} range: {s.index.min()} → {s.index.max()}  ({len(s)} rows)", flush=True)
+
+    # keep the caller's symbol order regardless of completion order
+    for sym in symbols:
+        if sym in fetched:
+            s = fetched[sym]
+            starts[sym] = s.index.min()
+            ends[sym]   = s.index.max()
+            series[sym] = s
 
     if not series:
         raise ValueError("No data returned for any symbol. Check interval/range/symbols/network.")
@@ -194,17 +212,17 @@ def build_px_ret(client, symbols, interval, start_ts, end_ts=None, pause=0.25, l
     print(f"\nCommon window (kept symbols): {common_start} → {common_end}")
 
     # 4) Concatenate and align on a full time grid within common window
-    px_raw = pd.concat([series[sym] for sym in keep], axis=1).sort_index()
+    px_raw = assemble_panel({sym: series[sym] for sym in keep})
 
     pd_freq = PD_FREQ_MAP.get(interval, None)
     if pd_freq is None:
         raise ValueError(f"No pandas frequency mapping for interval={interval}. Add it to PD_FREQ_MAP.")
 
     full_idx = pd.date_range(common_start, common_end, freq=pd_freq, tz="UTC")
-    px = px_raw.reindex(full_idx).ffill().dropna(how="any").copy()
+    px = ffill_dropna(px_raw.reindex(full_idx))
 
-    # 5) Log returns
-    ret = np.log(px / px.shift(1)).dropna()
+    # 5) Log returns (px is gap-free here, so one log pass + diff)
+    ret = pd.DataFrame(np.diff(np.log(px.to_numpy()), axis=0), index=px.index[1:], columns=px.columns)
 
     print(f"\nFinal shapes — px: {px.shape}, ret: {ret.shape}")
     return px, ret
@@ -232,5 +250,11 @@ def main():
     print(f"Saved px to {px_path}")
     print(f"Saved ret to {ret_path}")
 
+    # Parquet copies: load_panels prefers these (typed, no text parsing)
+    for df, path in ((px, px_path), (ret, ret_path)):
+        pq_path = os.path.splitext(path)[0] + ".parquet"
+        df.to_parquet(pq_path, compression="zstd")
+        print(f"Saved {pq_path}")
+
 if __name__ == "__main__":
     main()
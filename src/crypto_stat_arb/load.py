@@ -2,14 +2,53 @@ from __future__ import annotations
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
-def load_panels(data_dir: Path, px_name="px_1h.csv", ret_name="ret_1h.csv"):
+# datetime unit pandas gives parsed text timestamps (what read_csv(parse_dates=True) returned)
+_TS_UNIT = pd.to_datetime(["2000-01-01"]).unit
+
+def _read_panel_csv(path: Path) -> pd.DataFrame:
+    """
+    Read a panel CSV (timestamp index in the first column) with Arrow's
+    multithreaded parser; ISO timestamps are typed during the parse.
+    Date / timestamp indexes come back as a DatetimeIndex in pandas' own unit
+    (Arrow gives date32 -> datetime.date objects and second-resolution timestamps).
+    Entirely empty value columns (Arrow type null) are read as float64 NaN.
+    """
+    tbl = pacsv.read_csv(path)
+    idx_type = tbl.schema.field(0).type
+    if any(pa.types.is_null(f.type) for f in tbl.schema):
+        tbl = tbl.cast(pa.schema([
+            f.with_type(pa.float64()) if pa.types.is_null(f.type) else f for f in tbl.schema
+        ]))
+    df = tbl.to_pandas()
+    df = df.set_index(df.columns[0])
+    if pa.types.is_timestamp(idx_type) or pa.types.is_date(idx_type):
+        df.index = pd.DatetimeIndex(pd.to_datetime(df.index)).as_unit(_TS_UNIT)
+    df.index.name = df.index.name or None
+    return df
+
+def _read_panel(path: Path) -> pd.DataFrame:
+    """
+    Read a panel, preferring a sibling .parquet (typed, no text parsing) over the CSV.
+    A parquet file older than its CSV is treated as stale and ignored.
+    """
+    pq = path.with_suffix(".parquet")
+    if pq.exists() and (not path.exists() or pq.stat().st_mtime >= path.stat().st_mtime):
+        return pd.read_parquet(pq)
+    return _read_panel_csv(path)
+
+def load_panels(data_dir: Path, px_name="px_1h.csv", ret_name="ret_1h.csv", dtype=None):
     """
     Load price and return panels (RAW).
-    - Reads CSVs
+    - Reads px/ret from Parquet when a fresh .parquet sits next to the CSV,
+      otherwise from the CSVs (pyarrow parser)
     - Intersects columns so both frames share the same symbols
     - Sorts indexes
     - Does NOT align indexes, forward-fill, or drop rows
+    - Optionally casts both panels to `dtype` (e.g. np.float32 halves the bytes
+      moved by the signal code, which keeps the panel's precision)
 
     Returns
     -------
@@ -18,12 +57,15 @@ def load_panels(data_dir: Path, px_name="px_1h.csv", ret_name="ret_1h.csv"):
     ret : pd.DataFrame
         Raw returns with common columns, sorted index.
     """
-    px = pd.read_csv(data_dir / px_name, index_col=0, parse_dates=True).sort_index()
-    ret = pd.read_csv(data_dir / ret_name, index_col=0, parse_dates=True).sort_index()
+    px = _read_panel(data_dir / px_name).sort_index()
+    ret = _read_panel(data_dir / ret_name).sort_index()
 
     common = px.columns.intersection(ret.columns)
     px = px.loc[:, common]
     ret = ret.loc[:, common]
+    if dtype is not None:
+        px = px.astype(dtype, copy=False)
+        ret = ret.astype(dtype, copy=False)
 
     return px, ret
  # type: ignore
\ No newline at end of file
@@ -0,0 +1,27 @@
+from __future__ import annotations
+from functools import reduce
+import numpy as np
+import pandas as pd
+
+def assemble_panel(series: dict) -> pd.DataFrame:
+    """
+    Outer-join {symbol: close series} into one panel. The union index is built once
+    and each column is written by position (same as pd.concat(axis=1).sort_index()).
+    """
+    idx = reduce(lambda a, b: a.union(b), (s.index for s in series.values()))
+    out = np.full((len(idx), len(series)), np.nan, dtype=np.float64)
+    for j, s in enumerate(series.values()):
+        out[idx.get_indexer(s.index), j] = s.to_numpy()
+    return pd.DataFrame(out, index=idx, columns=list(series))
+
+def ffill_dropna(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Forward-fill each column, then drop rows that still hold a NaN
+    (same as df.ffill().dropna(how="any"), done as one gather on the ndarray).
+    """
+    arr = df.to_numpy(dtype=np.float64)
+    last = np.where(~np.isnan(arr), np.arange(len(arr))[:, None], 0)
+    np.maximum.accumulate(last, axis=0, out=last)
+    filled = arr[last, np.arange(arr.shape[1])]
+    keep = ~np.isnan(filled).any(axis=1)
+    return pd.DataFrame(filled[keep], index=df.index[keep], columns=df.columns)
@@ -6,10 +6,10 @@ def downsample_weights(w: pd.DataFrame, every: int | None = None) -> pd.DataFram
     """
     Hold weights constant between rebalances (every N bars).
     If every is None or <=1, return original w.
+    Each bar gathers the row of its last rebalance (one indexed copy, no NaN/ffill pass).
     """
     if every is None or every <= 1:
         return w
-    out = w.copy()
-    mask = np.arange(len(out)) % every != 0
-    out.iloc[mask] = np.nan
-    return out.ffill()
\ No newline at end of file
+    arr = w.to_numpy()
+    idx = (np.arange(len(arr)) // every) * every
+    return pd.DataFrame(arr[idx], index=w.index, columns=w.columns)
\ No newline at end of file
@@ -0,0 +1,42 @@
+from __future__ import annotations
+import numpy as np
+
+def rolling_sum(a: np.ndarray, w: int) -> np.ndarray:
+    """
+    Trailing w-bar sum along axis 0 via cumsum differences (one pass).
+    Windows containing any NaN are NaN, matching rolling(w, min_periods=w).sum().
+    Prefix sums accumulate in float64; the output keeps a's float dtype.
+    """
+    out = np.full(a.shape, np.nan, dtype=np.result_type(a.dtype, np.float32))
+    if w > len(a):
+        return out
+    valid = ~np.isnan(a)
+    has_nan = not valid.all()
+    c = np.cumsum(np.where(valid, a, 0.0) if has_nan else a, axis=0, dtype=np.float64)
+    out[w - 1] = c[w - 1]
+    np.subtract(c[w:], c[:-w], out=out[w:])
+    if has_nan:
+        n = np.cumsum(valid, axis=0)
+        cnt = n[w - 1:].copy()
+        cnt[1:] -= n[:-w]
+        out[w - 1:][cnt < w] = np.nan
+    return out
+
+def rolling_std(a: np.ndarray, w: int, zero_as_nan: bool = True) -> np.ndarray:
+    """
+    Trailing w-bar sample std (ddof=1) along axis 0 from window sums of a and a*a.
+    Windows of w equal values are exactly 0 (as in pandas), not the cancellation
+    residue of the sums. With zero_as_nan, zero std is returned as NaN so it can be
+    used directly as a divisor.
+    """
+    s1 = rolling_sum(a, w)
+    s2 = rolling_sum(a * a, w)
+    var = np.maximum((s2 - s1 * s1 / w) / (w - 1), 0.0)
+    # constant window <=> no value change between its w-1 consecutive pairs (exact count)
+    chg = np.zeros(a.shape)
+    chg[1:] = a[1:] != a[:-1]
+    var[(rolling_sum(chg, w - 1) == 0) & ~np.isnan(var)] = 0.0
+    sd = np.sqrt(var)
+    if zero_as_nan:
+        sd[sd == 0] = np.nan
+    return sd
@@ -1,44 +1,88 @@
 from __future__ import annotations
 import numpy as np
 import pandas as pd
-import sys
-from pathlib import Path
 
-HERE = Path(__file__).resolve()
-SRC = HERE.parents[1]          # this is .../src
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
-
-from crypto_stat_arb.config import BENCH_DEFAULT # type: ignore
+from .config import BENCH_DEFAULT
+from .rolling import rolling_sum, rolling_std
 
 # ----------------- helpers -----------------
 
+def _float_dtype(df: pd.DataFrame) -> np.dtype:
+    """float32 if every column is float32, else float64 (signals keep the panel's precision)."""
+    return np.result_type(np.float32, *df.dtypes)
+
 def residualize_to_bench(R: pd.DataFrame, bench: str | None, beta_win: int | None) -> pd.DataFrame:
     """
     Rolling regression on bench to remove alpha/beta; returns residuals. Drops bench column.
     If bench missing or beta_win=None, returns R unchanged.
+    Closed-form rolling OLS from window sums of x, y, x*y, x*x (no pandas rolling).
     """
     if bench is None or beta_win is None or bench not in R.columns:
         return R.copy()
-    x = R[bench]
-    cov = R.rolling(beta_win, min_periods=beta_win).cov(x)
-    var = x.rolling(beta_win, min_periods=beta_win).var()
-    beta = cov.div(var, axis=0)
-    alpha = R.rolling(beta_win, min_periods=beta_win).mean() - beta.mul(
-        x.rolling(beta_win, min_periods=beta_win).mean(), axis=0
-    )
-    resid = R - (alpha + beta.mul(x, axis=0))
-    return resid.drop(columns=[bench], errors="ignore")
+    w = int(beta_win)
+    Xr = R.drop(columns=[bench])
+    dt = _float_dtype(R)
+    x = R[bench].to_numpy(dtype=dt)
+    Y = Xr.to_numpy(dtype=dt)
+
+    # bench-only window stats: computed once as 1-D and broadcast across assets
+    sx = rolling_sum(x, w)
+    mx = sx / w
+    var_x = rolling_sum(x * x, w) - sx * mx          # w * var(x), ddof cancels in beta
+
+    sy = rolling_sum(Y, w)
+    sxy = rolling_sum(Y * x[:, None], w)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = sxy - mx[:, None] * sy                  # w * cov(x, y)
+        beta /= var_x[:, None]
+    # resid = y - (alpha + beta*x), alpha = mean_y - beta*mean_x
+    resid = Y - sy / w
+    resid -= beta * (x - mx)[:, None]
+    return pd.DataFrame(resid, index=R.index, columns=Xr.columns)
+
+def _zscore_rows(a: np.ndarray) -> np.ndarray:
+    """Cross-sectional (row-wise) z-score of a 2-D array, NaN-aware, zero std -> NaN."""
+    valid = ~np.isnan(a)
+    n = valid.sum(axis=1, dtype=a.dtype)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu = np.where(valid, a, 0.0).sum(axis=1) / n
+        z = a - mu[:, None]
+        sd = np.sqrt(np.where(valid, z * z, 0.0).sum(axis=1) / (n - 1))
+        sd[sd == 0] = np.nan
+        z /= sd[:, None]
+    return z
+
+def _neutral_l1_rows(a: np.ndarray) -> np.ndarray:
+    """Demean and L1-normalize each row IN PLACE; NaN entries and zero rows end up 0."""
+    valid = ~np.isnan(a)
+    a[~valid] = 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a -= a.sum(axis=1, keepdims=True) / valid.sum(axis=1, keepdims=True, dtype=a.dtype)
+    a[~valid] = 0.0                            # NaN inputs (and all-NaN rows) end up flat
+    l1 = np.abs(a).sum(axis=1, keepdims=True)
+    np.divide(a, l1, out=a, where=l1 > 0)
+    return a
 
 def _zscore_xs(df: pd.DataFrame) -> pd.DataFrame:
-    mu = df.mean(axis=1)
-    sd = df.std(axis=1).replace(0, np.nan)
-    return df.sub(mu, axis=0).div(sd, axis=0)
+    z = _zscore_rows(df.to_numpy(dtype=_float_dtype(df)))
+    return pd.DataFrame(z, index=df.index, columns=df.columns)
 
 def _neutral_l1(w: pd.DataFrame) -> pd.DataFrame:
-    w = w.sub(w.mean(axis=1), axis=0)         
-    l1 = w.abs().sum(axis=1).replace(0, np.nan)
-    return w.div(l1, axis=0).fillna(0.0)       
+    out = _neutral_l1_rows(w.to_numpy(dtype=_float_dtype(w), copy=True))
+    return pd.DataFrame(out, index=w.index, columns=w.columns)
+
+def _finalize_weights(sig: np.ndarray, band: float | None, vol: np.ndarray | None) -> np.ndarray:
+    """
+    z-score -> hard band -> optional inverse-vol -> neutral L1, on one (T, N) buffer.
+    No intermediate DataFrames; the caller wraps the result once.
+    """
+    w = _zscore_rows(sig)
+    if band and band > 0:
+        w[~(np.abs(w) >= band)] = 0.0         # NaN z falls outside the band too
+    if vol is not None:
+        w /= vol
+    return _neutral_l1_rows(w)
 
 # ----------------- strategies -----------------
 
@@ -59,16 +103,12 @@ def cs_reversal_weights(
     - L1-normalize & neutralize each bar
     """
     X = residualize_to_bench(R, bench, beta_win)
-    mom = X.rolling(k, min_periods=k).sum()
+    arr = X.to_numpy(dtype=_float_dtype(X))
+    mom = rolling_sum(arr, k)
     sig = -mom
-    z = _zscore_xs(sig)
-    if band and band > 0:
-        z = z.where(z.abs() >= band, 0.0)
-    w = z.copy()
-    if vol_win and vol_win > 1:
-        vol = X.rolling(vol_win, min_periods=vol_win).std().replace(0, np.nan)
-        w = w.div(vol, axis=1)
-    return _neutral_l1(w)
+    vol = rolling_std(arr, vol_win) if vol_win and vol_win > 1 else None
+    w = _finalize_weights(sig, band, vol)
+    return pd.DataFrame(w, index=X.index, columns=X.columns)
 
 def cs_momentum_weights(
     R: pd.DataFrame,
@@ -87,14 +127,11 @@ def cs_momentum_weights(
     - L1-normalize & neutralize each bar
     """
     X = residualize_to_bench(R, bench, beta_win)
-    X_lag = X.shift(24)
-    mom = X_lag.rolling(k, min_periods=k).sum()
+    arr = X.to_numpy(dtype=_float_dtype(X))
+    arr_lag = np.full_like(arr, np.nan)
+    arr_lag[24:] = arr[:-24]
+    mom = rolling_sum(arr_lag, k)
     sig = mom
-    z = _zscore_xs(sig)
-    if band and band > 0:
-        z = z.where(z.abs() >= band, 0.0)
-    w = z.copy()
-    if vol_win and vol_win > 1:
-        vol = X.rolling(vol_win, min_periods=vol_win).std().replace(0, np.nan)
-        w = w.div(vol, axis=1)
-    return _neutral_l1(w)
+    vol = rolling_std(arr, vol_win) if vol_win and vol_win > 1 else None
+    w = _finalize_weights(sig, band, vol)
+    return pd.DataFrame(w, index=X.index, columns=X.columns)
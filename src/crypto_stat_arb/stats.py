@@ -2,15 +2,10 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 import statsmodels.api as sm
-import sys
-from pathlib import Path
 
-HERE = Path(__file__).resolve()
-SRC = HERE.parents[1]          
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
-
-from crypto_stat_arb.config import ANNUALIZATION # type: ignore
+from .config import ANNUALIZATION
+from .backtest import max_drawdown
+from .rolling import rolling_sum, rolling_std
 
 def perf_summary_from_series(r: pd.Series, label: str, freq_per_year=ANNUALIZATION):
     """
@@ -22,9 +17,7 @@ def perf_summary_from_series(r: pd.Series, label: str, freq_per_year=ANNUALIZATI
     ann_ret = (1 + r).prod()**(freq_per_year / len(r)) - 1
     ann_vol = r.std() * np.sqrt(freq_per_year)
     sharpe  = np.nan if ann_vol == 0 else ann_ret / ann_vol
-    eq = (1 + r).cumprod()
-    peak = eq.cummax()
-    max_dd = (eq / peak - 1.0).min()
+    max_dd = max_drawdown(r)
     return {"label": label, "ann_ret": ann_ret, "ann_vol": ann_vol, "sharpe": sharpe, "max_dd": max_dd}
 
 def compute_alpha_beta(strategy_ret: pd.Series, bench_ret: pd.Series, freq=ANNUALIZATION, lag_bars=24):
@@ -62,22 +55,32 @@ def nw_mean_tstat(r, lag_bars: int = 24, freq=ANNUALIZATION):
     # Cap HAC lags to a sensible value
     maxlags = int(min(lag_bars, max(1, len(r)//2)))
 
-    X = np.ones((len(r), 1))  # intercept-only regression
-    model = sm.OLS(r.values, X).fit(cov_type="HAC", cov_kwds={"maxlags": maxlags})
-
-    mean_per_bar = float(model.params[0])
-    t_stat       = float(model.tvalues[0])
+    # Intercept-only OLS + HAC reduces to the Bartlett-weighted long-run variance of u
+    x = r.to_numpy()
+    n = len(x)
+    mean_per_bar = float(x.mean())
+    u = x - mean_per_bar
+    lrv = u @ u
+    for lag in range(1, min(maxlags, n - 1) + 1):
+        lrv += 2.0 * (1.0 - lag / (maxlags + 1)) * (u[lag:] @ u[:-lag])
+    se = np.sqrt(lrv) / n
+    t_stat       = np.nan if se == 0 else float(mean_per_bar / se)
     ann_mean     = mean_per_bar * freq
     return mean_per_bar, t_stat, ann_mean
 
 
 def rolling_sharpe(x: pd.Series, window_bars: int = 90) -> pd.Series:
-    """Rolling annualized Sharpe using trailing window (in bars)."""
+    """
+    Rolling annualized Sharpe using trailing window (in bars).
+    Window mean/std come from cumsum-difference rolling sums (no pandas rolling).
+    """
     w = window_bars * 24
-    mu = x.rolling(w).mean()
-    sd = x.rolling(w).std()
-    rs = (mu / sd) * np.sqrt(ANNUALIZATION)
-    return rs
+    a = x.to_numpy(dtype=np.float64)
+    mu = rolling_sum(a, w) / w
+    sd = rolling_std(a, w, zero_as_nan=False)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = mu / sd * np.sqrt(ANNUALIZATION)
+    return pd.Series(rs, index=x.index, name=x.name)
 
 def perf_summary_from_series_exact(r: pd.Series, label: str, freq_per_year=ANNUALIZATION):
     """
@@ -94,7 +97,6 @@ def perf_summary_from_series_exact(r: pd.Series, label: str, freq_per_year=ANNUA
     ann_vol = r.std() * np.sqrt(freq_per_year)
     sharpe  = np.nan if ann_vol == 0 else ann_ret / ann_vol
 
-    eq = (1.0 + r).cumprod()
-    max_dd = (eq / eq.cummax() - 1.0).min()
+    max_dd = max_drawdown(r)
 
     return {"label": label, "ann_ret": ann_ret, "ann_vol": ann_vol, "sharpe": sharpe, "max_dd": max_dd}
@@ -1,17 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+import os
 import pandas as pd
 import numpy as np
-import sys
-from pathlib import Path
 
-HERE = Path(__file__).resolve()
-SRC = HERE.parents[1]         
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
-
-from crypto_stat_arb.config import BARS_PER_DAY, COST_BPS, ANNUALIZATION # type: ignore
-from crypto_stat_arb.backtest import backtest, perf_stats # type: ignore
+from .config import BARS_PER_DAY, COST_BPS, ANNUALIZATION
+from .backtest import _backtest_np, perf_stats
 
 @dataclass
 class WFConfig:
@@ -37,16 +32,118 @@ def _wf_splits(index: pd.DatetimeIndex, train_days=365, test_days=90, mode="expa
         train_end = test_end
     return splits
 
-def _global_rebalance_mask(index: pd.DatetimeIndex, every: int | None) -> pd.Series:
+def _global_rebalance_mask(index: pd.DatetimeIndex, every: int | None) -> np.ndarray:
+    """Boolean rebalance flag per bar of `index`, by position (slice it positionally per fold)."""
     every = int(every or 1)
     if every <= 1:
-        return pd.Series(True, index=index)  # rebalance every bar
-    return pd.Series((np.arange(len(index)) % every) == 0, index=index)
+        return np.ones(len(index), dtype=bool)  # rebalance every bar
+    return (np.arange(len(index)) % every) == 0
+
+def _apply_schedule(w: pd.DataFrame, mask: np.ndarray) -> pd.DataFrame:
+    """
+    Hold weights from each rebalance bar (mask True) until the next one, as a single
+    row gather. Bars before the first rebalance in the window are NaN.
+    Rebalancing every bar (all-True mask) returns w itself.
+    """
+    if mask.all():
+        return w
+    last = np.where(mask, np.arange(len(mask)), -1)
+    np.maximum.accumulate(last, out=last)
+    out = w.to_numpy()[np.maximum(last, 0)]
+    out[last < 0] = np.nan
+    return pd.DataFrame(out, index=w.index, columns=w.columns)
+
+def _as_precision(R: pd.DataFrame, precision: str) -> pd.DataFrame:
+    """Cast returns for the signal path: "fp32" halves bytes moved, "fp64" keeps R as is."""
+    if precision == "fp32":
+        return R.astype(np.float32, copy=False)
+    if precision == "fp64":
+        return R
+    raise ValueError(f"Unknown precision: {precision}")
+
+def _map_folds(fold_func, jobs: list, n_jobs: int | None) -> list:
+    """
+    Run fold_func(*args) for every fold. Folds are independent, so with n_jobs > 1
+    (None -> os.cpu_count()) they run in a process pool; results keep fold order.
+    """
+    n_jobs = (os.cpu_count() or 1) if n_jobs is None else int(n_jobs)
+    if n_jobs <= 1 or len(jobs) <= 1:
+        return [fold_func(*args) for args in jobs]
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(jobs))) as ex:
+        return list(ex.map(fold_func, *zip(*jobs)))
+
+def _collect_folds(index: pd.DatetimeIndex, splits: list, results: list, mode: str,
+                   const_cols: dict, stat_cols: tuple):
+    """
+    Fold results -> (summary_df, stitched_oos_net).
+    Summary columns are filled into typed per-column arrays (no dict per fold);
+    `const_cols` are run-level values, `stat_cols` name each fold's stats row.
+    OOS P&L is written by position into one buffer over `index`, trimmed to the
+    covered span (test slices are contiguous, in time order).
+    """
+    n = len(splits)
+    oos_full = np.full(len(index), np.nan)
+    stats = np.empty((n, len(stat_cols)))
+    for k, ((_, te_slice), (row, net_te)) in enumerate(zip(splits, results)):
+        oos_full[te_slice] = net_te
+        stats[k] = row
+
+    # date metadata straight from the split bounds, one gather per column
+    bounds = np.array(
+        [(tr.start, tr.stop - 1, te.start, te.stop - 1) for tr, te in splits], dtype=np.int64
+    ).reshape(n, 4)                                  # train_start, train_end, test_start, test_end
+    tr_start, tr_end = index[bounds[:, 0]], index[bounds[:, 1]]
+    te_start, te_end = index[bounds[:, 2]], index[bounds[:, 3]]
+
+    folds = pd.DataFrame({
+        "fold": np.arange(1, n + 1, dtype=np.int32), "mode": mode,
+        "train_start": tr_start, "train_end": tr_end,
+        "test_start":  te_start, "test_end":  te_end,
+        "train_days": (tr_end - tr_start).days.to_numpy(np.int64) + 1,
+        "test_days":  (te_end - te_start).days.to_numpy(np.int64) + 1,
+        **const_cols,
+        **{c: stats[:, j] for j, c in enumerate(stat_cols)},
+    })
+    lo = splits[0][1].start if splits else 0
+    hi = splits[-1][1].stop if splits else 0
+    return folds, pd.Series(oos_full[lo:hi], index=index[lo:hi])
+
+_TEST_STATS = ("test_ann_ret", "test_ann_vol", "test_sharpe")
+
+def _aligned_arrays(R_fold: pd.DataFrame, *ws: pd.DataFrame):
+    """
+    (X, W, ...) ndarrays over the columns shared by R_fold and the weights, same as
+    backtest()'s intersection. All `ws` must share one column index.
+    Row-major (C order), so row slices pickled to workers keep the same layout and
+    the row-wise backtest sums are bit-identical in and out of the process pool.
+    """
+    cols = ws[0].columns.intersection(R_fold.columns)
+
+    def take(df):
+        return np.ascontiguousarray(df.to_numpy()[:, df.columns.get_indexer(cols)])
+
+    return (take(R_fold), *(take(w) for w in ws))
 
-def _apply_schedule(w: pd.DataFrame, mask: pd.Series) -> pd.DataFrame:
-    out = w.copy()
-    out.loc[~mask] = np.nan
-    return out.ffill()
+def _fold_arrays(R_fold, mask_fold, params, weight_func):
+    """weight_func on the fold window, GLOBAL schedule applied -> aligned (X, W) ndarrays."""
+    w_fold = _apply_schedule(weight_func(R_fold, **params), mask_fold)
+    return _aligned_arrays(R_fold, w_fold)
+
+def _run_fold(tr_len, cost_bps, arrays=None, R_fold=None, mask_fold=None, params=None, weight_func=None):
+    """
+    One single-strategy fold; returns (stats_row, net_test) with stats_row in
+    _TEST_STATS order. `arrays` are precomputed aligned (X, W) rows of the window
+    (expanding mode); otherwise they are built here from R_fold via weight_func,
+    with `params` its kwargs already stripped of "every". Test rows start at tr_len.
+    """
+    if arrays is None:
+        arrays = _fold_arrays(R_fold, mask_fold, params, weight_func)
+
+    # DataFrames stop at the weight_func boundary: the rest runs on ndarrays
+    X, W = arrays
+    net_te = _backtest_np(W[tr_len:], X[tr_len:], cost_bps / 10_000)[0]
+    stats_te = perf_stats(net_te)
+    return (stats_te["ann_ret"], stats_te["ann_vol"], stats_te["sharpe"]), net_te
 
 def run_walk_forward(
     R: pd.DataFrame,
@@ -54,48 +151,150 @@ def run_walk_forward(
     cost_bps: int = COST_BPS,
     cfg: WFConfig = WFConfig(),
     weight_func=None,
+    n_jobs: int | None = 1,
+    precision: str = "fp64",
 ):
     """
     Single-strategy walk-forward.
     Build weights from TRAIN+TEST window (rolling ops prevent lookahead in signals),
     then apply in TEST slice with chosen rebalance cadence (params['every']).
+    weight_func MUST be causal (row t uses only rows <= t): in expanding mode it is
+    called once on all of R and each fold takes its prefix, so a non-causal
+    weight_func would leak bars after the fold's test window into its weights.
+    Folds are independent; n_jobs > 1 (None -> all cores) runs them in a process pool.
+    In rolling mode with n_jobs > 1, weight_func and params are pickled to the workers,
+    so weight_func must be a module-level function (no lambda / notebook closure).
+    precision="fp32" runs the signals on float32 returns (P&L stats stay float64).
     Returns (summary_df, stitched_oos_net).
     """
     assert weight_func is not None, "Provide weight_func (e.g., cs_reversal_weights)"
+    R = _as_precision(R, precision)
     splits = _wf_splits(R.index, cfg.train_days, cfg.test_days, cfg.mode)
 
     # build global mask once
     every = int(params.get("every", 1) or 1)
     mask_global = _global_rebalance_mask(R.index, every)
+    params_ne = {k: v for k, v in params.items() if k != "every"}  # weight_func kwargs, built once
+
+    if cfg.mode == "expanding":
+        # Expanding folds are prefixes of R and the signals are causal, so weights over
+        # the full R sliced to a fold equal the fold's own run. The global schedule is
+        # position-based from bar 0 as well: compute and schedule once in this process.
+        # Each job then carries only its TEST rows of (X, W): O(T) pickled in total.
+        X, W = _fold_arrays(R, mask_global, params_ne, weight_func)
+        jobs = [(0, cost_bps, (X[te_slice], W[te_slice])) for _, te_slice in splits]
+    else:
+        # each job carries its own TRAIN+TEST window, mask slice, params and weight_func
+        jobs = [
+            (tr_slice.stop - tr_slice.start, cost_bps, None, R.iloc[tr_slice.start:te_slice.stop],
+             mask_global[tr_slice.start:te_slice.stop], params_ne, weight_func)
+            for tr_slice, te_slice in splits
+        ]
+    results = _map_folds(_run_fold, jobs, n_jobs)
+    return _collect_folds(R.index, splits, results, cfg.mode, {"cost_bps": cost_bps}, _TEST_STATS)
+
+def _net_std_np(W: np.ndarray, X: np.ndarray, cost_rate: float) -> float:
+    """Sample std (ddof=1) of a sleeve's net P&L: the only TRAIN figure equal_vol needs."""
+    return float(np.std(_backtest_np(W, X, cost_rate)[0], ddof=1))
+
+def _blend_weights(net_rev: np.ndarray | None, net_mom: np.ndarray | None, mix_mode: str,
+                   w_mom_static: float | None = None, opt_grid: np.ndarray | None = None,
+                   sd_rev: float | None = None, sd_mom: float | None = None):
+    """
+    Sleeve blend weights (w_rev_mix, w_mom_mix) from TRAIN sleeve figures.
+    "equal_vol" reads the per-bar net stds `sd_rev` / `sd_mom` (see _net_std_np);
+    "train_opt" reads the TRAIN net returns `net_rev` / `net_mom` (1-D arrays).
+    Inputs a mode doesn't read may be None.
+    """
+    if mix_mode == "equal_vol":
+        vol_rev = sd_rev * (ANNUALIZATION ** 0.5)
+        vol_mom = sd_mom * (ANNUALIZATION ** 0.5)
+        w_rev_mix = 0.5 if vol_rev == 0 else 0.5 / vol_rev
+        w_mom_mix = 0.5 if vol_mom == 0 else 0.5 / vol_mom
+        s = w_rev_mix + w_mom_mix
+        return float(w_rev_mix / s), float(w_mom_mix / s)
 
-    folds, oos_segments = [], []
-    for i, (tr_slice, te_slice) in enumerate(splits, 1):
-        R_train = R.iloc[tr_slice]
-        R_test  = R.iloc[te_slice]
+    if mix_mode == "5050":
+        return 0.5, 0.5
 
-        R_fold = R.iloc[tr_slice.start:te_slice.stop]
-        w_fold = weight_func(R_fold, **{k: v for k, v in params.items() if k != "every"})
+    if mix_mode == "static":
+        assert w_mom_static is not None, "Provide w_mom_static when mix_mode='static'"
+        return 1.0 - float(w_mom_static), float(w_mom_static)
+
+    if mix_mode == "train_opt":
+        grid = np.asarray(opt_grid if opt_grid is not None else np.linspace(0.0, 1.0, 51), dtype=float)
+        # all blends at once: (T, 2) @ (2, G) -> (T, G), then per-column Sharpe
+        rets = np.column_stack([net_rev, net_mom])
+        rets = rets[~np.isnan(rets).any(axis=1)]
+        best_w = 0.5
+        if len(rets) > 1:
+            mix_tr = rets @ np.vstack([1.0 - grid, grid])
+            mu, sd = mix_tr.mean(axis=0), mix_tr.std(axis=0, ddof=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sharpe = np.where(sd > 0, mu / sd, np.nan) * np.sqrt(ANNUALIZATION)
+            if np.isfinite(sharpe).any():
+                best_w = float(grid[np.argmax(np.where(np.isfinite(sharpe), sharpe, -np.inf))])
+        return 1.0 - best_w, best_w
+
+    raise ValueError(f"Unknown mix_mode: {mix_mode}")
+
+def _mix_weights(w_rev: np.ndarray, w_mom: np.ndarray, a: float, b: float) -> np.ndarray:
+    """a * w_rev + b * w_mom into one new buffer (no pandas alignment)."""
+    out = np.multiply(w_rev, a)
+    out += b * w_mom
+    return out
+
+def _mixed_arrays(R_fold, mask_rev, mask_mom, params_rev, params_mom, reversal_func, momentum_func):
+    """
+    Both sleeves on the fold window (GLOBAL schedules applied) -> aligned
+    (X, W_rev, W_mom) ndarrays on one shared column set.
+    """
+    w_rev_all = _apply_schedule(reversal_func(R_fold, **params_rev), mask_rev)
+    w_mom_all = _apply_schedule(momentum_func(R_fold, **params_mom), mask_mom)
+    if not w_rev_all.columns.equals(w_mom_all.columns):
+        # e.g. only one sleeve residualizes (drops bench): same outer join as `+` would do.
+        # The added all-NaN columns are flat, so sleeve P&L is unchanged.
+        w_rev_all, w_mom_all = w_rev_all.align(w_mom_all, join="outer", axis=1)
+    return _aligned_arrays(R_fold, w_rev_all, w_mom_all)
+
+def _run_fold_mixed(tr_len, mix_mode, w_mom_static, opt_grid, cost_bps, arrays=None,
+                    R_fold=None, mask_rev=None, mask_mom=None, params_rev=None, params_mom=None,
+                    reversal_func=None, momentum_func=None):
+    """
+    One two-sleeve fold; returns (stats_row, net_test) with
+    stats_row = (w_rev_mix, w_mom_mix, *_TEST_STATS).
+    `arrays` are precomputed aligned (X, W_rev, W_mom) rows of the window (expanding
+    mode); otherwise the sleeves are built here ONCE on R_fold, with `params_rev` /
+    `params_mom` their kwargs already stripped of "every". Test rows start at tr_len.
+    """
+    if arrays is None:
+        arrays = _mixed_arrays(R_fold, mask_rev, mask_mom, params_rev, params_mom,
+                               reversal_func, momentum_func)
 
-        # apply GLOBAL schedule within the fold window, then slice test
-        mask_fold = mask_global.loc[R_fold.index]
-        w_fold = _apply_schedule(w_fold, mask_fold).loc[R_test.index]
+    # DataFrames stop at the weight_func boundary: the rest runs on ndarrays
+    X, W_rev, W_mom = arrays
+    cost_rate = cost_bps / 10_000
 
-        net_te, _, _ = backtest(w_fold, R_test, cost_rate=cost_bps / 10_000)
-        stats_te = perf_stats(net_te)
+    # sleeve TRAIN backtests are only needed when the blend is estimated from them:
+    # equal_vol reads one std per sleeve, train_opt the full net P&L
+    net_rev_tr = net_mom_tr = sd_rev = sd_mom = None
+    if mix_mode == "equal_vol":
+        sd_rev = _net_std_np(W_rev[:tr_len], X[:tr_len], cost_rate)
+        sd_mom = _net_std_np(W_mom[:tr_len], X[:tr_len], cost_rate)
+    elif mix_mode == "train_opt":
+        net_rev_tr = _backtest_np(W_rev[:tr_len], X[:tr_len], cost_rate)[0]
+        net_mom_tr = _backtest_np(W_mom[:tr_len], X[:tr_len], cost_rate)[0]
 
-        folds.append({
-            "fold": i, "mode": cfg.mode,
-            "train_start": R_train.index[0], "train_end": R_train.index[-1],
-            "test_start":  R_test.index[0],  "test_end":  R_test.index[-1],
-            "train_days": (R_train.index[-1] - R_train.index[0]).days + 1,
-            "test_days":  (R_test.index[-1]  - R_test.index[0]).days  + 1,
-            "cost_bps": cost_bps,
-            "test_ann_ret": stats_te["ann_ret"], "test_ann_vol": stats_te["ann_vol"], "test_sharpe": stats_te["sharpe"],
-        })
-        net_te.index = R_test.index
-        oos_segments.append(net_te)
+    w_rev_mix, w_mom_mix = _blend_weights(
+        net_rev_tr, net_mom_tr, mix_mode, w_mom_static, opt_grid, sd_rev=sd_rev, sd_mom=sd_mom
+    )
 
-    return pd.DataFrame(folds), pd.concat(oos_segments).sort_index()
+    # test rows are the contiguous tail of the fold window: positional slice
+    w_mix_test = _mix_weights(W_rev[tr_len:], W_mom[tr_len:], w_rev_mix, w_mom_mix)
+    net_te = _backtest_np(w_mix_test, X[tr_len:], cost_rate)[0]
+    stats_te = perf_stats(net_te)
+    row = (w_rev_mix, w_mom_mix, stats_te["ann_ret"], stats_te["ann_vol"], stats_te["sharpe"])
+    return row, net_te
 
 def run_walk_forward_mixed(
     R: pd.DataFrame,
@@ -112,87 +311,56 @@ def run_walk_forward_mixed(
     momentum_func=None,
     w_mom_static: float | None = None,            # <— NEW (for mix_mode="static")
     opt_grid: np.ndarray | None = None,           # <— NEW (for mix_mode="train_opt")
+    n_jobs: int | None = 1,
+    precision: str = "fp64",
 ):
     """
     Multi-sleeve walk-forward with equal-vol, 50/50 blend and static optimizer.
-    - Train sleeves on TRAIN to estimate blend weights (if equal_vol)
-    - Recompute sleeves on TRAIN+TEST (no lookahead in rolling ops), slice TEST
-    - Blend sleeves in TEST using train-estimated weights
+    - Build sleeves once per fold on TRAIN+TEST (no lookahead in rolling ops, so the
+      TRAIN rows equal a train-only run); in expanding mode once on all of R, each
+      fold taking its prefix
+    - reversal_func / momentum_func MUST therefore be causal (row t uses only rows
+      <= t), otherwise later bars leak into TRAIN blend estimates and TEST weights
+    - Use the TRAIN rows to estimate blend weights (if equal_vol / train_opt)
+    - Blend the TEST rows using train-estimated weights
+    Folds are independent; n_jobs > 1 (None -> all cores) runs them in a process pool.
+    In rolling mode with n_jobs > 1, reversal_func / momentum_func and their params are
+    pickled to the workers, so they must be module-level functions (no lambda /
+    notebook closure).
+    precision="fp32" runs the signals on float32 returns (P&L stats stay float64).
     Returns (summary_df, stitched_oos_net).
     """
     assert reversal_func is not None and momentum_func is not None, "Provide reversal_func and momentum_func"
+    R = _as_precision(R, precision)
     splits = _wf_splits(R.index, train_days, test_days, mode)
 
     mask_rev_global = _global_rebalance_mask(R.index, every_rev)
     mask_mom_global = _global_rebalance_mask(R.index, every_mom)
+    params_rev_ne = {k: v for k, v in params_rev.items() if k != "every"}  # sleeve kwargs, built once
+    params_mom_ne = {k: v for k, v in params_mom.items() if k != "every"}
 
-    folds, oos_segments = [], []
-    for i, (tr_slice, te_slice) in enumerate(splits, 1):
-        R_train = R.iloc[tr_slice]
-        R_test  = R.iloc[te_slice]
-
-        # Train-only sleeves (use GLOBAL schedule sliced to the train window)
-        w_rev_tr = reversal_func(R_train, **{k: v for k, v in params_rev.items() if k != "every"})
-        w_rev_tr = _apply_schedule(w_rev_tr, mask_rev_global.loc[R_train.index])
-        w_mom_tr = momentum_func(R_train, **{k: v for k, v in params_mom.items() if k != "every"})
-        w_mom_tr = _apply_schedule(w_mom_tr, mask_mom_global.loc[R_train.index])
-
-        net_rev_tr, _, _ = backtest(w_rev_tr, R_train, cost_rate=cost_bps / 10_000)
-        net_mom_tr, _, _ = backtest(w_mom_tr, R_train, cost_rate=cost_bps / 10_000)
-
-        if mix_mode == "equal_vol":
-            vol_rev = net_rev_tr.std() * (ANNUALIZATION ** 0.5)
-            vol_mom = net_mom_tr.std() * (ANNUALIZATION ** 0.5)
-            w_rev_mix = 0.5 if vol_rev == 0 else 0.5 / vol_rev
-            w_mom_mix = 0.5 if vol_mom == 0 else 0.5 / vol_mom
-            s = w_rev_mix + w_mom_mix
-            w_rev_mix /= s; w_mom_mix /= s
-
-        elif mix_mode == "5050":
-            w_rev_mix = w_mom_mix = 0.5
-
-        elif mix_mode == "static":
-            assert w_mom_static is not None, "Provide w_mom_static when mix_mode='static'"
-            w_mom_mix = float(w_mom_static)
-            w_rev_mix = 1.0 - w_mom_mix
-
-        elif mix_mode == "train_opt":
-            grid = opt_grid if opt_grid is not None else np.linspace(0.0, 1.0, 51)
-            best_w, best_s = 0.5, -np.inf
-            for w in grid:
-                mix_tr = (1 - w) * net_rev_tr + w * net_mom_tr
-                s = perf_stats(mix_tr.dropna())["sharpe"]
-                if np.isfinite(s) and s > best_s:
-                    best_s, best_w = s, float(w)
-            w_mom_mix = best_w
-            w_rev_mix = 1.0 - best_w
-
-        else:
-            raise ValueError(f"Unknown mix_mode: {mix_mode}")
-
-
-        R_fold = R.iloc[tr_slice.start:te_slice.stop]
-        w_rev_fold = reversal_func(R_fold, **{k: v for k, v in params_rev.items() if k != "every"})
-        w_rev_fold = _apply_schedule(w_rev_fold, mask_rev_global.loc[R_fold.index]).loc[R_test.index]
-
-        w_mom_fold = momentum_func(R_fold, **{k: v for k, v in params_mom.items() if k != "every"})
-        w_mom_fold = _apply_schedule(w_mom_fold, mask_mom_global.loc[R_fold.index]).loc[R_test.index]
-
-        w_mix_test = (w_rev_mix * w_rev_fold) + (w_mom_mix * w_mom_fold)
-        net_te, _, _ = backtest(w_mix_test, R_test, cost_rate=cost_bps / 10_000)
-        stats_te = perf_stats(net_te)
-
-        folds.append({
-            "fold": i, "mode": mode,
-            "train_start": R_train.index[0], "train_end": R_train.index[-1],
-            "test_start":  R_test.index[0],  "test_end":  R_test.index[-1],
-            "train_days": (R_train.index[-1] - R_train.index[0]).days + 1,
-            "test_days":  (R_test.index[-1]  - R_test.index[0]).days  + 1,
-            "mix_mode": mix_mode, "cost_bps": cost_bps,
-            "w_rev_mix": w_rev_mix, "w_mom_mix": w_mom_mix,
-            "test_ann_ret": stats_te["ann_ret"], "test_ann_vol": stats_te["ann_vol"], "test_sharpe": stats_te["sharpe"],
-        })
-        net_te.index = R_test.index
-        oos_segments.append(net_te)
-
-    return pd.DataFrame(folds), pd.concat(oos_segments).sort_index()
+    if mode == "expanding":
+        # expanding folds are prefixes of R: build and schedule each sleeve once over R
+        # in this process. Jobs carry only the rows they read: TEST rows, plus the
+        # growing TRAIN prefix when the blend is estimated (equal_vol / train_opt).
+        X, W_rev, W_mom = _mixed_arrays(R, mask_rev_global, mask_mom_global, params_rev_ne,
+                                        params_mom_ne, reversal_func, momentum_func)
+        needs_train = mix_mode in ("equal_vol", "train_opt")
+        jobs = []
+        for tr_slice, te_slice in splits:
+            lo = tr_slice.start if needs_train else te_slice.start
+            rows = slice(lo, te_slice.stop)
+            jobs.append((te_slice.start - lo, mix_mode, w_mom_static, opt_grid, cost_bps,
+                         (X[rows], W_rev[rows], W_mom[rows])))
+    else:
+        # each job carries its own TRAIN+TEST window, mask slices, params and sleeve funcs
+        jobs = [
+            (tr_slice.stop - tr_slice.start, mix_mode, w_mom_static, opt_grid, cost_bps, None,
+             R.iloc[tr_slice.start:te_slice.stop],
+             mask_rev_global[tr_slice.start:te_slice.stop], mask_mom_global[tr_slice.start:te_slice.stop],
+             params_rev_ne, params_mom_ne, reversal_func, momentum_func)
+            for tr_slice, te_slice in splits
+        ]
+    results = _map_folds(_run_fold_mixed, jobs, n_jobs)
+    return _collect_folds(R.index, splits, results, mode, {"mix_mode": mix_mode, "cost_bps": cost_bps},
+                          ("w_rev_mix", "w_mom_mix") + _TEST_STATS)